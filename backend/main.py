@@ -4,27 +4,58 @@ Backend Implementation with RAG, Agentic AI, Quantum Simulation, and Blockchain
 """
 
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Dict, Optional, Any
-import requests
+import httpx
 import asyncio
 import json
 import hashlib
+import re
 import time
 from datetime import datetime
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import numpy as np
 from dataclasses import dataclass
 import logging
 from enum import Enum
-import uuid
 import os
 
+# Optional vector-search stack (see requirements.txt); the knowledge base
+# falls back to token matching when these are not installed
+try:
+    import faiss
+    from sentence_transformers import SentenceTransformer
+    VECTOR_SEARCH_AVAILABLE = True
+except ImportError:
+    faiss = None
+    SentenceTransformer = None
+    VECTOR_SEARCH_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="ClimaX Backend", description="Climate Resilience OS Backend")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize on startup, release shared resources on shutdown"""
+    logger.info("🚀 ClimaX Backend Starting Up...")
+    logger.info("🤖 AI Agents: Initialized")
+    logger.info("⚛️ Quantum Optimizer: Ready")
+    logger.info("🔗 Blockchain: Genesis block created")
+    logger.info("🧠 RAG System: Knowledge base loaded")
+    logger.info("🌤️ Weather Service: Connected")
+    logger.info("✅ ClimaX Backend Ready!")
+    yield
+    await http_client.aclose()
+
+app = FastAPI(title="ClimaX Backend", description="Climate Resilience OS Backend",
+              lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Add CORS middleware
 app.add_middleware(
@@ -35,6 +66,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+def new_id() -> str:
+    """Random 128-bit hex id; one urandom read, no UUID object or formatting"""
+    return os.urandom(16).hex()
+
 # ==================== MODELS ====================
 
 class DisasterType(str, Enum):
@@ -50,6 +85,11 @@ class AlertLevel(str, Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
+# Precomputed value -> member maps; Enum.__call__ scans members on every
+# coercion, a dict lookup doesn't
+DISASTER_TYPE_MAP = {member.value: member for member in DisasterType}
+ALERT_LEVEL_MAP = {member.value: member for member in AlertLevel}
+
 @dataclass
 class WeatherData:
     temperature: float
@@ -111,30 +151,38 @@ class QuantumResourceOptimizer:
         """
         start_time = time.time()
 
-        # Simulate quantum computation delay
-        await asyncio.sleep(0.1)
+        # Simulated quantum delay is opt-in; by default every request held a
+        # coroutine alive for 100 ms of pure sleep
+        if os.getenv("CLIMAX_SIMULATE_QUANTUM_DELAY"):
+            await asyncio.sleep(0.1)
+
+        # Pack demands into one (regions x resources) matrix so the totals
+        # and the proportional allocation are single vectorized ops
+        resource_keys = sorted({key for region_demand in demands.values() for key in region_demand})
+        demand_matrix = np.zeros((len(regions), len(resource_keys)), dtype=np.int64)
+        for i, region in enumerate(regions):
+            region_demand = demands.get(region, {})
+            for j, key in enumerate(resource_keys):
+                demand_matrix[i, j] = region_demand.get(key, 0)
 
-        # Simulate optimization results
-        total_demand = sum(sum(region_demand.values()) for region_demand in demands.values())
+        total_demand = int(demand_matrix.sum())
         total_supply = sum(resources.values())
+        allocation_ratio = min(total_supply / total_demand, 1.0) if total_demand > 0 else 1.0
+        allocation_matrix = (demand_matrix * allocation_ratio).astype(np.int64)
 
         optimization_result = {
             "status": "optimal" if total_supply >= total_demand else "suboptimal",
             "total_supply": total_supply,
             "total_demand": total_demand,
             "allocation": {},
-            "efficiency_score": min(total_supply / total_demand, 1.0) * 100
+            "efficiency_score": allocation_ratio * 100
         }
 
-        # Distribute resources proportionally
-        for region in regions:
-            region_demand = demands.get(region, {})
-            region_total = sum(region_demand.values())
-            allocation_ratio = min(total_supply / total_demand, 1.0) if total_demand > 0 else 1.0
-
+        # Materialize per-region dicts once, keeping only each region's own keys
+        for i, region in enumerate(regions):
+            row = dict(zip(resource_keys, allocation_matrix[i].tolist()))
             optimization_result["allocation"][region] = {
-                resource: int(demand * allocation_ratio)
-                for resource, demand in region_demand.items()
+                resource: row[resource] for resource in demands.get(region, {})
             }
 
         runtime = time.time() - start_time
@@ -151,26 +199,50 @@ class BlockchainLedger:
     def __init__(self):
         self.chain = []
         self.pending_alerts = []
+        # Incrementally maintained integrity state so health probes don't
+        # re-hash the whole chain on every hit
+        self._valid = True
+        self._verified_upto = 0
+        # Canonical serialized payload per block, cached at insert time so
+        # verification never re-serializes
+        self._block_data_bytes = []
         self.create_genesis_block()
         logger.info("Initialized Blockchain Ledger (Simulated)")
 
     def create_genesis_block(self):
+        created_at = datetime.now().isoformat()
         genesis_block = {
             "index": 0,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": created_at,
             "data": "Genesis Block",
             "previous_hash": "0",
-            "hash": self.calculate_hash("0", "Genesis Block", datetime.now().isoformat())
+            "hash": self.calculate_hash("0", "Genesis Block", created_at)
         }
         self.chain.append(genesis_block)
+        self._block_data_bytes.append(b"Genesis Block")
+
+    def calculate_hash(self, previous_hash, data, timestamp) -> str:
+        """Calculate SHA-256 hash for blockchain
 
-    def calculate_hash(self, previous_hash: str, data: str, timestamp: str) -> str:
-        """Calculate SHA-256 hash for blockchain"""
-        block_string = f"{previous_hash}{data}{timestamp}"
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        Fragments are fed straight into the hasher (bytes pass through
+        unencoded) instead of building a concatenated copy of the block
+        per call; hashlib dispatches to OpenSSL's hardware-accelerated
+        SHA-256 where available. The digest matches the old
+        f-string-then-encode construction.
+        """
+        h = hashlib.sha256()
+        for part in (previous_hash, data, timestamp):
+            h.update(part if isinstance(part, bytes) else part.encode())
+        return h.hexdigest()
+
+    def add_alert_to_chain(self, alert: DisasterAlert, timestamp: Optional[datetime] = None) -> str:
+        """Add disaster alert to blockchain
 
-    def add_alert_to_chain(self, alert: DisasterAlert) -> str:
-        """Add disaster alert to blockchain"""
+        Reuses the alert's own timestamp by default so the request path
+        doesn't make another clock_gettime syscall per block.
+        """
+        timestamp = timestamp or alert.timestamp
+        block_time = timestamp.isoformat() if isinstance(timestamp, datetime) else str(timestamp)
         previous_block = self.chain[-1]
         
         # Convert alert to dict for JSON serialization
@@ -188,25 +260,74 @@ class BlockchainLedger:
         
         new_block = {
             "index": len(self.chain),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": block_time,
             "data": alert_dict,
             "previous_hash": previous_block["hash"],
             "hash": ""
         }
 
+        data_bytes = json.dumps(new_block["data"], sort_keys=True).encode()
         new_block["hash"] = self.calculate_hash(
-            new_block["previous_hash"],
-            json.dumps(new_block["data"], sort_keys=True),
-            new_block["timestamp"]
+            new_block["previous_hash"].encode(),
+            data_bytes,
+            new_block["timestamp"].encode()
         )
 
         self.chain.append(new_block)
+        self._block_data_bytes.append(data_bytes)
+
+        # Only the new link needs checking to extend the verified prefix
+        if self._valid and self._verified_upto == len(self.chain) - 2:
+            if new_block["previous_hash"] == previous_block["hash"]:
+                self._verified_upto = len(self.chain) - 1
+            else:
+                self._valid = False
+
         logger.info(f"Alert {alert.id} added to blockchain with hash {new_block['hash']}")
         return new_block["hash"]
 
-    def verify_chain(self) -> bool:
-        """Verify blockchain integrity"""
-        for i in range(1, len(self.chain)):
+    def verify_chain(self, force: bool = False) -> bool:
+        """Verify blockchain integrity
+
+        The fast path returns the incrementally maintained flag; pass
+        force=True to re-hash every block from the genesis block.
+        """
+        if not force:
+            return self._valid
+
+        self._valid = self._full_verify()
+        if self._valid:
+            self._verified_upto = len(self.chain) - 1
+        return self._valid
+
+    def _full_verify(self) -> bool:
+        """Re-hash and re-link every block in the chain
+
+        Large chains are split into even/odd halves verified on two
+        threads; each block links to a stored hash, so the halves are
+        independent, and hashlib releases the GIL so the two SHA-256
+        streams genuinely overlap.
+        """
+        n = len(self.chain)
+
+        # Backfill the payload cache up front if the chain grew outside
+        # add_alert_to_chain; the worker threads only index it, so it must
+        # not be mutated once they are dispatched
+        if len(self._block_data_bytes) < n:
+            self._block_data_bytes.extend(
+                json.dumps(self.chain[j]["data"], sort_keys=True).encode()
+                for j in range(len(self._block_data_bytes), n)
+            )
+
+        if n > 256:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                results = pool.map(self._verify_blocks, [range(1, n, 2), range(2, n, 2)])
+            return all(results)
+        return self._verify_blocks(range(1, n))
+
+    def _verify_blocks(self, indices) -> bool:
+        """Check the link and hash of each block in `indices`"""
+        for i in indices:
             current_block = self.chain[i]
             previous_block = self.chain[i-1]
 
@@ -215,7 +336,7 @@ class BlockchainLedger:
 
             if current_block["hash"] != self.calculate_hash(
                 current_block["previous_hash"],
-                json.dumps(current_block["data"], sort_keys=True),
+                self._block_data_bytes[i],
                 current_block["timestamp"]
             ):
                 return False
@@ -230,7 +351,24 @@ class ClimateKnowledgeBase:
     def __init__(self):
         self.documents = []
         self.embeddings = {}
+        self.token_sets = {}
+        self.encoder = None
+        self.index = None
+        # Approximate query cache: recent (embedding, filter, results) entries
+        self.query_cache = []
+        self.query_cache_size = 128
+        self.query_cache_threshold = 0.95
         self.load_climate_knowledge()
+        if VECTOR_SEARCH_AVAILABLE:
+            try:
+                self.build_vector_index()
+            except Exception as e:
+                # First boot downloads the encoder from Hugging Face; an
+                # offline host or a bad model cache must not keep the API
+                # from starting - token-set search still serves queries
+                logger.warning(f"Vector index unavailable, using keyword fallback: {e}")
+                self.encoder = None
+                self.index = None
         logger.info("Initialized Climate Knowledge Base with RAG")
 
     def load_climate_knowledge(self):
@@ -263,35 +401,114 @@ class ClimateKnowledgeBase:
         ]
 
         self.documents = knowledge_base
-        # In real implementation, you'd use sentence transformers for embeddings
         for doc in knowledge_base:
-            # Simulate embedding with simple hash for demo
-            self.embeddings[doc["id"]] = hash(doc["content"]) % 1000
+            # Precompute lowercase token set once so queries match via set
+            # intersection instead of rescanning the content string
+            self.token_sets[doc["id"]] = frozenset(re.findall(r"\w+", doc["content"].lower()))
+
+    def build_vector_index(self):
+        """Embed documents once and build a FAISS index for similarity search"""
+        self.encoder = SentenceTransformer("all-MiniLM-L6-v2")
+        doc_vectors = self.encoder.encode(
+            [doc["content"] for doc in self.documents],
+            normalize_embeddings=True
+        ).astype(np.float32)
+        dim = doc_vectors.shape[1]
+
+        # IVF with fast-scan product quantization pays off on large corpora;
+        # below the training threshold a flat inner-product index is exact
+        # and just as fast
+        if len(self.documents) >= 1024:
+            self.index = faiss.index_factory(dim, "IVF16,PQ8x4fs", faiss.METRIC_INNER_PRODUCT)
+            self.index.train(doc_vectors)
+        else:
+            self.index = faiss.IndexFlatIP(dim)
+        self.index.add(doc_vectors)
+
+        for i, doc in enumerate(self.documents):
+            self.embeddings[doc["id"]] = doc_vectors[i]
+
+    def check_query_cache(self, query_vec, disaster_type: str = None) -> Optional[List[Dict]]:
+        """Return a cached result whose query embedding is close enough"""
+        if not self.query_cache:
+            return None
+
+        # One (N, d) @ (d,) matmul scores the whole cache at once
+        cached_vecs = np.stack([entry[0] for entry in self.query_cache])
+        scores = cached_vecs @ query_vec
+        best = int(np.argmax(scores))
+
+        if scores[best] >= self.query_cache_threshold and self.query_cache[best][1] == disaster_type:
+            return self.query_cache[best][2]
+        return None
 
     def query_knowledge(self, query: str, disaster_type: str = None) -> List[Dict]:
         """Query knowledge base using RAG"""
-        # Simple similarity search simulation
-        # In real implementation, use FAISS or similar vector DB
+        if self.index is not None:
+            query_vec = self.encoder.encode([query], normalize_embeddings=True).astype(np.float32)
+
+            # Near-duplicate queries skip the index scan entirely
+            cached = self.check_query_cache(query_vec[0], disaster_type)
+            if cached is not None:
+                return cached
+
+            _, doc_ids = self.index.search(query_vec, len(self.documents))
+
+            relevant_docs = []
+            for doc_id in doc_ids[0]:
+                if doc_id < 0:
+                    continue
+                doc = self.documents[doc_id]
+                if disaster_type and doc["disaster_type"] != disaster_type:
+                    continue
+                relevant_docs.append(doc)
+                if len(relevant_docs) == 3:
+                    break
+
+            if len(self.query_cache) >= self.query_cache_size:
+                self.query_cache.pop(0)
+            self.query_cache.append((query_vec[0], disaster_type, relevant_docs))
+            return relevant_docs
+
+        # Token-set fallback when the vector stack is not installed
         relevant_docs = []
+        query_tokens = frozenset(word.lower() for word in query.split())
 
         for doc in self.documents:
             if disaster_type and doc["disaster_type"] != disaster_type:
                 continue
 
-            # Simple keyword matching for demo
-            if any(word.lower() in doc["content"].lower() for word in query.split()):
+            # Hashed token-set intersection instead of substring scans
+            if self.token_sets[doc["id"]] & query_tokens:
                 relevant_docs.append(doc)
 
         return relevant_docs[:3]  # Return top 3 relevant documents
 
+# Shared knowledge base - loaded once at import, reused by all agents and endpoints
+climate_kb = ClimateKnowledgeBase()
+
 # ==================== AGENTIC AI MODULE ====================
 
+# Threshold tables: one vectorized compare replaces the if-cascade in
+# analyze_threat. THREAT_LEVELS is indexed by the mask bits
+# (heatwave=1, flood=2, cyclone=4) and mirrors the original branch order,
+# where a later branch overwrote the level set by an earlier one.
+THREAT_THRESHOLDS = np.array([40.0, 50.0, 60.0], dtype=np.float32)
+THREAT_LABELS = ("heatwave", "flood", "cyclone")
+THREAT_RECOMMENDATIONS = (
+    "Stay indoors during peak hours",
+    "Avoid low-lying areas",
+    "Evacuate to higher ground"
+)
+THREAT_LEVELS = ("low", "high", "medium", "medium",
+                 "critical", "critical", "critical", "critical")
+
 class RegionalAIAgent:
     """Agentic AI for regional climate intelligence"""
 
-    def __init__(self, region: str):
+    def __init__(self, region: str, kb: ClimateKnowledgeBase = climate_kb):
         self.region = region
-        self.knowledge_base = ClimateKnowledgeBase()
+        self.knowledge_base = kb
         self.alert_history = []
         logger.info(f"Initialized Regional AI Agent for {region}")
 
@@ -312,38 +529,44 @@ class RegionalAIAgent:
             "recommendations": []
         }
 
-        # Simple rule-based threat detection (simulate AI)
-        if weather_data.temperature > 40:
-            threat_analysis["threat_level"] = "high"
-            threat_analysis["predicted_disasters"].append("heatwave")
-            threat_analysis["recommendations"].append("Stay indoors during peak hours")
-
-        if weather_data.precipitation > 50:
-            threat_analysis["threat_level"] = "medium"
-            threat_analysis["predicted_disasters"].append("flood")
-            threat_analysis["recommendations"].append("Avoid low-lying areas")
-
-        if weather_data.wind_speed > 60:
-            threat_analysis["threat_level"] = "critical"
-            threat_analysis["predicted_disasters"].append("cyclone")
-            threat_analysis["recommendations"].append("Evacuate to higher ground")
+        # Simple rule-based threat detection (simulate AI): compare all
+        # measurements against the threshold vector at once and look the
+        # level up from the resulting mask bits
+        measurements = np.array([
+            weather_data.temperature,
+            weather_data.precipitation,
+            weather_data.wind_speed
+        ], dtype=np.float32)
+        mask = measurements > THREAT_THRESHOLDS
+        fired = np.flatnonzero(mask)
+
+        threat_analysis["predicted_disasters"] = [THREAT_LABELS[i] for i in fired]
+        threat_analysis["recommendations"] = [THREAT_RECOMMENDATIONS[i] for i in fired]
+        threat_analysis["threat_level"] = THREAT_LEVELS[
+            int(mask[0]) | int(mask[1]) << 1 | int(mask[2]) << 2
+        ]
 
         return threat_analysis
 
-    def generate_alert(self, threat_analysis: Dict[str, Any]) -> Optional[DisasterAlert]:
+    def generate_alert(self, threat_analysis: Dict[str, Any],
+                       now: Optional[datetime] = None) -> Optional[DisasterAlert]:
         """Generate disaster alert based on threat analysis"""
 
         if threat_analysis["threat_level"] in ["medium", "high", "critical"]:
+            if now is None:
+                now = datetime.now()
             alert = DisasterAlert(
-                id=str(uuid.uuid4()),
+                id=new_id(),
                 region=self.region,
-                disaster_type=threat_analysis["predicted_disasters"][0] if threat_analysis["predicted_disasters"] else "flood",
-                alert_level=AlertLevel(threat_analysis["threat_level"]),
+                disaster_type=DISASTER_TYPE_MAP[
+                    threat_analysis["predicted_disasters"][0] if threat_analysis["predicted_disasters"] else "flood"
+                ],
+                alert_level=ALERT_LEVEL_MAP[threat_analysis["threat_level"]],
                 description=f"AI-detected threat in {self.region}: {', '.join(threat_analysis['predicted_disasters'])}",
                 affected_area={"radius_km": 50, "population": 100000},
                 evacuation_routes=[{"route_id": "R1", "status": "open"}],
                 resources_needed={"water": 1000, "food": 500, "medical": 100},
-                timestamp=datetime.now(),
+                timestamp=now,
                 blockchain_hash=""
             )
 
@@ -353,24 +576,53 @@ class RegionalAIAgent:
         return None
 # ==================== WEATHER DATA SERVICE ====================
 
+# Shared async HTTP client so concurrent requests reuse pooled connections
+# instead of blocking a threadpool thread per call
+http_client = httpx.AsyncClient(
+    timeout=5.0,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+)
+
 class WeatherService:
     """Weather data service using OpenWeatherMap API"""
 
     def __init__(self):
         self.api_key = os.getenv("OPENWEATHER_API_KEY", "demo_key")
         self.base_url = "http://api.openweathermap.org/data/2.5"
+        # Pre-drawn mock samples: one vectorized draw replaces five scalar
+        # np.random calls per demo request
+        self._rng = np.random.default_rng()
+        self._mock_buffer = self._draw_mock_samples()
+        self._mock_idx = 0
+
+    def _draw_mock_samples(self) -> np.ndarray:
+        """Draw a batch of (temp, humidity, pressure, wind, precip) rows"""
+        return self._rng.uniform(
+            low=[25, 40, 990, 5, 0],
+            high=[45, 90, 1020, 25, 20],
+            size=(4096, 5)
+        )
+
+    def _next_mock_sample(self) -> np.ndarray:
+        row = self._mock_buffer[self._mock_idx]
+        self._mock_idx += 1
+        if self._mock_idx == len(self._mock_buffer):
+            self._mock_buffer = self._draw_mock_samples()
+            self._mock_idx = 0
+        return row
 
     async def get_weather_data(self, city: str) -> WeatherData:
         """Fetch weather data from OpenWeatherMap"""
 
         if self.api_key == "demo_key":
             # Return mock data for demo
+            temperature, humidity, pressure, wind_speed, precipitation = self._next_mock_sample()
             return WeatherData(
-                temperature=np.random.uniform(25, 45),
-                humidity=np.random.uniform(40, 90),
-                pressure=np.random.uniform(990, 1020),
-                wind_speed=np.random.uniform(5, 25),
-                precipitation=np.random.uniform(0, 20),
+                temperature=float(temperature),
+                humidity=float(humidity),
+                pressure=float(pressure),
+                wind_speed=float(wind_speed),
+                precipitation=float(precipitation),
                 location=city,
                 timestamp=datetime.now()
             )
@@ -383,7 +635,7 @@ class WeatherService:
                 "units": "metric"
             }
 
-            response = requests.get(url, params=params)
+            response = await http_client.get(url, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -416,11 +668,24 @@ regional_agents = {
     "kolkata": RegionalAIAgent("Kolkata")
 }
 
-# In-memory storage (use database in production)
-citizen_reports = []
-disaster_alerts = []
+# In-memory storage (use database in production); bounded deques cap memory
+# and the per-region index makes regional lookups O(limit) instead of O(N)
+citizen_reports = deque(maxlen=1000)
+# JSON-ready mirror of citizen_reports, built once at submission so reads
+# skip Pydantic re-serialization entirely
+citizen_reports_json = deque(maxlen=1000)
+disaster_alerts = deque(maxlen=1000)
+disaster_alerts_by_region = defaultdict(lambda: deque(maxlen=1000))
 resource_optimizations = []
 
+# Monotonic totals for the dashboard, updated on write; the deques above
+# cap at maxlen, so their lengths stop reflecting lifetime counts
+stats = {"alerts": 0, "reports": 0, "optimizations": 0}
+
+def tail(items, limit: int) -> list:
+    """Last `limit` entries of a deque without copying the whole thing"""
+    return list(islice(items, max(len(items) - limit, 0), None))
+
 # ==================== API ENDPOINTS ====================
 
 @app.get("/")
@@ -467,13 +732,16 @@ async def analyze_threat(region: str):
 
     threat_analysis = agent.analyze_threat(weather_data)
 
-    # Generate alert if threat level is significant
-    alert = agent.generate_alert(threat_analysis)
+    # Generate alert if threat level is significant; reuse the timestamp
+    # captured when the weather was fetched
+    alert = agent.generate_alert(threat_analysis, now=weather_data.timestamp)
     if alert:
         # Add to blockchain
         blockchain_hash = blockchain.add_alert_to_chain(alert)
         alert.blockchain_hash = blockchain_hash
         disaster_alerts.append(alert)
+        disaster_alerts_by_region[alert.region.lower()].append(alert)
+        stats["alerts"] += 1
 
         threat_analysis["alert_generated"] = True
         threat_analysis["alert_id"] = alert.id
@@ -484,7 +752,7 @@ async def analyze_threat(region: str):
 @app.post("/citizen-report")
 async def submit_citizen_report(report: CitizenReport):
     """Submit citizen disaster report"""
-    report.id = str(uuid.uuid4())
+    report.id = new_id()
     report.timestamp = datetime.now()
 
     # Simple verification simulation (in real app, use AI for verification)
@@ -492,27 +760,25 @@ async def submit_citizen_report(report: CitizenReport):
         report.verified = True
 
     citizen_reports.append(report)
+    stats["reports"] += 1
+    citizen_reports_json.append({
+        "id": report.id,
+        "location": report.location,
+        "disaster_type": report.disaster_type,
+        "severity": report.severity,
+        "description": report.description,
+        "image_url": report.image_url,
+        "timestamp": report.timestamp.isoformat(),
+        "verified": report.verified
+    })
     logger.info(f"Citizen report submitted: {report.id}")
 
     return {"status": "success", "report_id": report.id, "verified": report.verified}
 @app.get("/citizen-reports")
 async def get_citizen_reports(limit: int = 10):
     """Get recent citizen reports"""
-    # Convert to dict format for JSON serialization
-    reports_data = []
-    for report in citizen_reports[-limit:]:
-        report_dict = {
-            "id": report.id,
-            "location": report.location,
-            "disaster_type": report.disaster_type,
-            "severity": report.severity,
-            "description": report.description,
-            "image_url": report.image_url,
-            "timestamp": report.timestamp.isoformat() if isinstance(report.timestamp, datetime) else report.timestamp,
-            "verified": report.verified
-        }
-        reports_data.append(report_dict)
-    return reports_data
+    # Dicts were serialized at submission time; no per-read conversion
+    return tail(citizen_reports_json, limit)
 
 @app.post("/optimize-resources")
 async def optimize_resources(request: Dict[str, Any]):
@@ -533,6 +799,7 @@ async def optimize_resources(request: Dict[str, Any]):
     )
 
     resource_optimizations.append(resource_opt)
+    stats["optimizations"] += 1
 
     return optimization_result
 
@@ -541,7 +808,7 @@ async def get_alerts(limit: int = 10):
     """Get recent disaster alerts"""
     # Convert to dict format for JSON serialization
     alerts_data = []
-    for alert in disaster_alerts[-limit:]:
+    for alert in tail(disaster_alerts, limit):
         alert_dict = {
             "id": alert.id,
             "region": alert.region,
@@ -560,11 +827,12 @@ async def get_alerts(limit: int = 10):
 @app.get("/alerts/{region}")
 async def get_regional_alerts(region: str, limit: int = 10):
     """Get alerts for specific region"""
-    regional_alerts = [alert for alert in disaster_alerts if alert.region.lower() == region.lower()]
-    
+    # .get keeps unknown regions from inserting permanent empty deques
+    regional_alerts = tail(disaster_alerts_by_region.get(region.lower(), ()), limit)
+
     # Convert to dict format for JSON serialization
     alerts_data = []
-    for alert in regional_alerts[-limit:]:
+    for alert in regional_alerts:
         alert_dict = {
             "id": alert.id,
             "region": alert.region,
@@ -583,7 +851,8 @@ async def get_regional_alerts(region: str, limit: int = 10):
 @app.get("/blockchain/verify")
 async def verify_blockchain():
     """Verify blockchain integrity"""
-    is_valid = blockchain.verify_chain()
+    # Full re-hash is CPU-bound; keep it off the event loop
+    is_valid = await run_in_threadpool(blockchain.verify_chain, force=True)
     return {
         "valid": is_valid,
         "blocks": len(blockchain.chain),
@@ -598,19 +867,18 @@ async def get_blockchain():
 @app.get("/knowledge/query")
 async def query_knowledge(query: str, disaster_type: Optional[str] = None):
     """Query climate knowledge base using RAG"""
-    kb = ClimateKnowledgeBase()
-    results = kb.query_knowledge(query, disaster_type)
+    results = climate_kb.query_knowledge(query, disaster_type)
     return {"query": query, "results": results}
 
 @app.get("/simulation/dashboard")
 async def get_dashboard_data():
     """Get dashboard data for simulation"""
     return {
-        "total_alerts": len(disaster_alerts),
+        "total_alerts": stats["alerts"],
         "active_regions": len(regional_agents),
-        "citizen_reports": len(citizen_reports),
+        "citizen_reports": stats["reports"],
         "blockchain_blocks": len(blockchain.chain),
-        "recent_optimizations": len(resource_optimizations),
+        "recent_optimizations": stats["optimizations"],
         "system_health": {
             "weather_service": "online",
             "blockchain": "verified" if blockchain.verify_chain() else "error",
@@ -627,10 +895,18 @@ async def generate_test_alerts():
         test_regions = ["delhi", "mumbai", "bangalore"]
         generated_alerts = []
 
-        for region in test_regions:
+        # Fan out the weather fetches so the three round-trips overlap
+        weather_results = await asyncio.gather(
+            *(weather_service.get_weather_data(region) for region in test_regions),
+            return_exceptions=True
+        )
+
+        for region, weather_data in zip(test_regions, weather_results):
             try:
+                if isinstance(weather_data, Exception):
+                    raise weather_data
+
                 logger.info(f"Generating alert for {region}...")
-                weather_data = await weather_service.get_weather_data(region)
                 agent = regional_agents[region]
 
                 # Force high threat for demo
@@ -638,12 +914,14 @@ async def generate_test_alerts():
                 weather_data.precipitation = 60
 
                 threat_analysis = agent.analyze_threat(weather_data)
-                alert = agent.generate_alert(threat_analysis)
+                alert = agent.generate_alert(threat_analysis, now=weather_data.timestamp)
 
                 if alert:
                     blockchain_hash = blockchain.add_alert_to_chain(alert)
                     alert.blockchain_hash = blockchain_hash
                     disaster_alerts.append(alert)
+                    disaster_alerts_by_region[alert.region.lower()].append(alert)
+                    stats["alerts"] += 1
                     generated_alerts.append(alert)
                     logger.info(f"Generated alert for {region}: {alert.id}")
 
@@ -676,19 +954,10 @@ async def generate_test_alerts():
         logger.error(f"Error in generate_test_alerts: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to generate test alerts: {str(e)}")
 
-# ==================== STARTUP EVENT ====================
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize system on startup"""
-    logger.info("🚀 ClimaX Backend Starting Up...")
-    logger.info("🤖 AI Agents: Initialized")
-    logger.info("⚛️ Quantum Optimizer: Ready")
-    logger.info("🔗 Blockchain: Genesis block created")
-    logger.info("🧠 RAG System: Knowledge base loaded")
-    logger.info("🌤️ Weather Service: Connected")
-    logger.info("✅ ClimaX Backend Ready!")
-
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Import-string launch so uvicorn can fork workers; the in-memory
+    # stores are per-process, so keep CLIMAX_WORKERS at 1 until they move
+    # to an external backend like Redis
+    uvicorn.run("main:app", host="0.0.0.0", port=8000,
+                workers=int(os.getenv("CLIMAX_WORKERS", "1")))
\ No newline at end of file